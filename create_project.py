@@ -5,13 +5,17 @@ Create project and add all existing issues to it
 
 import os
 import sys
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
+import orjson
 import requests
 import yaml
-import time
+from sync import WRITE_RATE_LIMIT_PER_SECOND, YAML_LOADER, rate_limit_wait
 
 # Load config
 with open('config.yaml', 'r') as f:
-    config = yaml.safe_load(f)
+    config = yaml.load(f, Loader=YAML_LOADER)
 
 token = os.environ.get('GITHUB_TOKEN')
 if not token:
@@ -44,9 +48,10 @@ query {
   }
 }
 """
-response = requests.post(graphql_url, headers=headers_graphql, json={"query": query})
-user_id = response.json()["data"]["viewer"]["id"]
-user_login = response.json()["data"]["viewer"]["login"]
+response = requests.post(graphql_url, headers=headers_graphql, data=orjson.dumps({"query": query}))
+viewer = orjson.loads(response.content)["data"]["viewer"]
+user_id = viewer["id"]
+user_login = viewer["login"]
 print(f"\n👤 User: {user_login}")
 
 # Create project
@@ -64,8 +69,8 @@ mutation($ownerId: ID!, $title: String!) {
 """
 variables = {"ownerId": user_id, "title": config['project_name']}
 response = requests.post(graphql_url, headers=headers_graphql,
-                        json={"query": mutation, "variables": variables})
-project_data = response.json()["data"]["createProjectV2"]["projectV2"]
+                        data=orjson.dumps({"query": mutation, "variables": variables}))
+project_data = orjson.loads(response.content)["data"]["createProjectV2"]["projectV2"]
 project_id = project_data["id"]
 project_number = project_data["number"]
 project_url = project_data["url"]
@@ -77,30 +82,86 @@ print(f"  🔗 {project_url}")
 print(f"\n📥 Fetching issues from {repo}...")
 url = f"https://api.github.com/repos/{repo}/issues?state=all&per_page=100"
 response = requests.get(url, headers=headers_rest)
-issues = response.json()
+issues = orjson.loads(response.content)
 print(f"  ✓ Found {len(issues)} issues")
 
 # Add issues to project
-print(f"\n➕ Adding issues to project...")
-for i, issue in enumerate(issues, 1):
-    mutation = """
-    mutation($projectId: ID!, $contentId: ID!) {
-      addProjectV2ItemById(input: {projectId: $projectId, contentId: $contentId}) {
-        item {
-          id
-        }
-      }
-    }
-    """
-    variables = {"projectId": project_id, "contentId": issue['node_id']}
+BATCH_SIZE = 50  # aliased mutations per GraphQL request
+ASYNC_CONCURRENCY = 10  # batches in flight at once
+
+
+def build_batch(batch):
+    """Build one GraphQL document adding every issue in batch"""
+    params = ", ".join(f"$c{i}: ID!" for i in range(len(batch)))
+    fields = "\n".join(
+        f"  a{i}: addProjectV2ItemById(input: {{projectId: $p, contentId: $c{i}}}) {{ item {{ id }} }}"
+        for i in range(len(batch))
+    )
+    mutation = f"mutation($p: ID!, {params}) {{\n{fields}\n}}"
+    variables = {"p": project_id}
+    variables.update({f"c{i}": issue['node_id'] for i, issue in enumerate(batch)})
+    return {"query": mutation, "variables": variables}
+
+
+async def post_graphql(session, limiter, payload):
+    """POST a GraphQL payload, backing off on rate-limit responses"""
+    while True:
+        async with limiter:
+            response = await session.post(graphql_url, data=orjson.dumps(payload), headers=headers_graphql)
+        async with response:
+            wait, retry = rate_limit_wait(response.status, response.headers, await response.text())
+            if wait:
+                print(f"  ⏳ Rate limit reached, waiting {wait}s...")
+                await asyncio.sleep(wait)
+            if retry:
+                continue
+            response.raise_for_status()
+            return orjson.loads(await response.read())
+
+
+async def add_batch(session, sem, limiter, batch):
+    """Add one batch of issues to the project"""
+    async with sem:
+        try:
+            result = await post_graphql(session, limiter, build_batch(batch))
+        except Exception as e:
+            for issue in batch:
+                print(f"  ✗ Failed to add #{issue['number']}: {e}")
+            return
+    
+    # Match each error to its alias (a0, a1, ...) via path[0]; the rest apply to the whole batch
+    alias_errors = {}
+    for error in result.get("errors") or []:
+        path = error.get("path") or []
+        if path and str(path[0]).startswith("a"):
+            alias_errors.setdefault(path[0], error.get("message"))
+        else:
+            print(f"  ✗ Batch error: {error.get('message')}")
     
-    try:
-        requests.post(graphql_url, headers=headers_graphql,
-                     json={"query": mutation, "variables": variables})
-        print(f"  ✓ Added #{issue['number']}: {issue['title']}")
-        time.sleep(0.2)  # Rate limiting
-    except Exception as e:
-        print(f"  ✗ Failed to add #{issue['number']}: {e}")
+    data = result.get("data") or {}
+    for i, issue in enumerate(batch):
+        if data.get(f"a{i}"):
+            print(f"  ✓ Added #{issue['number']}: {issue['title']}")
+        elif f"a{i}" in alias_errors:
+            print(f"  ✗ Failed to add #{issue['number']}: {alias_errors[f'a{i}']}")
+        else:
+            print(f"  ✗ Failed to add #{issue['number']}")
+
+
+async def add_issues(issues):
+    """Add all issues to the project concurrently"""
+    sem = asyncio.Semaphore(ASYNC_CONCURRENCY)
+    limiter = AsyncLimiter(max_rate=WRITE_RATE_LIMIT_PER_SECOND, time_period=1)
+    connector = aiohttp.TCPConnector(limit=20)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*[
+            add_batch(session, sem, limiter, issues[start:start + BATCH_SIZE])
+            for start in range(0, len(issues), BATCH_SIZE)
+        ])
+
+
+print(f"\n➕ Adding issues to project...")
+asyncio.run(add_issues(issues))
 
 print("\n" + "=" * 70)
 print("✅ Project setup complete!")
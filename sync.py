@@ -5,17 +5,85 @@ Bidirectional sync between tracker.md and GitHub Issues + Projects
 """
 
 import os
+import hashlib
 import re
+import asyncio
 import sys
-import json
 import time
-from typing import Dict, List, Optional, Tuple
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yaml
 
 # Configuration
 TRACKER_FILE = "tracker.md"
 CONFIG_FILE = "config.yaml"
+CACHE_FILE = ".sync-cache.sqlite"
+SINCE_OVERLAP_SECONDS = 300  # refetch window behind the newest cached updatedAt
+FULL_REFRESH_SECONDS = 24 * 60 * 60  # how often to rebuild the issue cache from scratch
+ETAG_CACHE_FILE = ".github-etag-cache.json"
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)  # libyaml parser when available
+PUSH_CONCURRENCY = 10  # issue updates in flight at once (creates run serially)
+RATE_LIMIT_PER_SECOND = 30  # reads; GitHub secondary rate limit headroom
+WRITE_RATE_LIMIT_PER_SECOND = 1  # POST/PATCH and mutations; ~80 content-creating requests/min, 900 points/min at 5 per write
+SECONDARY_RATE_LIMIT_WAIT = 60  # GitHub's fallback when a rate-limit 403/429 has no Retry-After
+RATE_LIMIT_RESERVE = 100  # pause until reset when fewer calls remain
+
+TRACKER_ID_RE = re.compile(r'<!-- tracker-id: (.+?) -->')
+ID_FIELD_RE = re.compile(r'\s+id:\s*(.+)$')
+GITHUB_FIELD_RE = re.compile(r'\s+github:\s*')
+
+
+def rate_limit_wait(status_code: int, headers, body: str = "") -> Tuple[int, bool]:
+    """Seconds to pause after a response, and whether the request should be retried"""
+    now = int(time.time())
+    wait = 0
+    
+    # Hold back when the hourly budget is nearly spent
+    remaining = headers.get('X-RateLimit-Remaining')
+    if remaining is not None and int(remaining) < RATE_LIMIT_RESERVE:
+        wait = max(int(headers.get('X-RateLimit-Reset', now + 60)) - now, 0)
+    
+    # Rate-limited 403/429: retry after Retry-After, or after the reset waited for above
+    if status_code in (403, 429):
+        if retry_after := headers.get('Retry-After'):
+            return max(wait, int(retry_after)), True
+        if remaining == '0':
+            return max(wait, 1), True
+        # Secondary limit without headers; a permissions 403 has no "rate limit" message
+        if status_code == 429 or 'rate limit' in body.lower():
+            return max(wait, SECONDARY_RATE_LIMIT_WAIT), True
+    return wait, False
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per `period` seconds"""
+    
+    def __init__(self, rate: int, period: float = 1.0):
+        self.capacity = rate
+        self.tokens = float(rate)
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request token is available"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
+
 
 class GitHubAPI:
     def __init__(self, token: str, owner: str, repo: str):
@@ -32,35 +100,145 @@ class GitHubAPI:
             "Authorization": f"bearer {token}",
             "Content-Type": "application/json"
         }
+        
+        # Persistent session so keep-alive reuses the connection to api.github.com
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+        self.session.headers.update(self.headers)
+        self.rate_limiter = RateLimiter(RATE_LIMIT_PER_SECOND)
+        self.write_limiter = RateLimiter(WRITE_RATE_LIMIT_PER_SECOND)
+        
+        # url -> {etag, body}; conditional GETs that return 304 are free
+        self.etag_cache = {}
+        self.etag_cache_dirty = False
+        if os.path.exists(ETAG_CACHE_FILE):
+            with open(ETAG_CACHE_FILE, 'rb') as f:
+                self.etag_cache = orjson.loads(f.read())
     
-    def get_issues(self) -> List[Dict]:
-        """Fetch all issues (open + closed)"""
-        issues = []
-        page = 1
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+    
+    def save_etag_cache(self):
+        """Persist the ETag cache to disk if anything new was stored"""
+        if not self.etag_cache_dirty:
+            return
+        with open(ETAG_CACHE_FILE, 'wb') as f:
+            f.write(orjson.dumps(self.etag_cache))
+    
+    def _request(self, method: str, url: str, write: Optional[bool] = None, **kwargs) -> requests.Response:
+        """Send a request, waiting out GitHub rate limits (403/429) before retrying; writes use the slower limiter"""
+        if write is None:
+            write = method in ("POST", "PATCH")
+        limiter = self.write_limiter if write else self.rate_limiter
+        if "json" in kwargs:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {"Content-Type": "application/json", **kwargs.get("headers", {})}
         while True:
-            url = f"{self.base_url}/issues?state=all&page={page}&per_page=100"
-            response = requests.get(url, headers=self.headers)
+            limiter.acquire()
+            response = self.session.request(method, url, **kwargs)
+            
+            wait, retry = rate_limit_wait(response.status_code, response.headers, response.text)
+            if wait:
+                print(f"  ⏳ Rate limit reached, waiting {wait}s...")
+                time.sleep(wait)
+            if retry:
+                continue
             response.raise_for_status()
-            batch = response.json()
-            if not batch:
+            return response
+    
+    def _graphql(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Run a GraphQL query and return its data, raising on GraphQL errors"""
+        response = self._request("POST", self.graphql_url, headers=self.graphql_headers,
+                                 write=query.lstrip().startswith("mutation"),
+                                 json={"query": query, "variables": variables or {}})
+        result = orjson.loads(response.content)
+        if result.get("errors"):
+            raise RuntimeError(f"GraphQL error: {result['errors'][0].get('message')}")
+        return result["data"]
+    
+    def _cached_get(self, url: str) -> Any:
+        """GET with If-None-Match, returning the cached body on 304"""
+        cached = self.etag_cache.get(url)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        response = self._request("GET", url, headers=headers)
+        if response.status_code == 304:
+            return cached["body"]
+        
+        body = orjson.loads(response.content)
+        if etag := response.headers.get("ETag"):
+            self.etag_cache[url] = {"etag": etag, "body": body}
+            self.etag_cache_dirty = True
+        return body
+    
+    def get_issues_graphql(self, since: Optional[str] = None) -> List[Dict]:
+        """Fetch issues via GraphQL, optionally only those updated since an ISO timestamp"""
+        query = """
+        query($owner: String!, $name: String!, $cursor: String, $since: DateTime) {
+          repository(owner: $owner, name: $name) {
+            issues(first: 100, after: $cursor, states: [OPEN, CLOSED], filterBy: {since: $since}) {
+              pageInfo {
+                hasNextPage
+                endCursor
+              }
+              nodes {
+                id
+                number
+                title
+                state
+                body
+                updatedAt
+                labels(first: 100) {
+                  nodes {
+                    name
+                  }
+                }
+                milestone {
+                  title
+                  number
+                }
+              }
+            }
+          }
+        }
+        """
+        variables = {"owner": self.owner, "name": self.repo, "cursor": None, "since": since}
+        issues = []
+        while True:
+            repository = self._graphql(query, variables)["repository"]
+            
+            # Normalize to the REST issue shape used everywhere else
+            for node in repository["issues"]["nodes"]:
+                issues.append({
+                    'node_id': node['id'],
+                    'number': node['number'],
+                    'title': node['title'],
+                    'state': node['state'].lower(),
+                    'body': node['body'],
+                    'updated_at': node['updatedAt'],
+                    'labels': node['labels']['nodes'],
+                    'milestone': node['milestone']
+                })
+            
+            page_info = repository["issues"]["pageInfo"]
+            if not page_info["hasNextPage"]:
                 break
-            issues.extend(batch)
-            page += 1
+            variables["cursor"] = page_info["endCursor"]
         return issues
     
-    def get_labels(self) -> List[Dict]:
-        """Fetch all labels"""
-        url = f"{self.base_url}/labels"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
-    
     def get_milestones(self) -> List[Dict]:
         """Fetch all milestones"""
-        url = f"{self.base_url}/milestones?state=all"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return self._cached_get(f"{self.base_url}/milestones?state=all&per_page=100")
     
     def create_issue(self, title: str, body: str, labels: List[str], 
                      milestone: Optional[int] = None) -> Dict:
@@ -74,9 +252,8 @@ class GitHubAPI:
             data["milestone"] = milestone
         
         url = f"{self.base_url}/issues"
-        response = requests.post(url, headers=self.headers, json=data)
-        response.raise_for_status()
-        return response.json()
+        response = self._request("POST", url, json=data)
+        return orjson.loads(response.content)
     
     def update_issue(self, number: int, title: Optional[str] = None,
                      body: Optional[str] = None, labels: Optional[List[str]] = None,
@@ -95,9 +272,8 @@ class GitHubAPI:
             data["state"] = state
         
         url = f"{self.base_url}/issues/{number}"
-        response = requests.patch(url, headers=self.headers, json=data)
-        response.raise_for_status()
-        return response.json()
+        response = self._request("PATCH", url, json=data)
+        return orjson.loads(response.content)
     
     def get_user_id(self) -> str:
         """Get user ID for GraphQL"""
@@ -109,10 +285,7 @@ class GitHubAPI:
           }
         }
         """
-        response = requests.post(self.graphql_url, headers=self.graphql_headers, 
-                                json={"query": query})
-        response.raise_for_status()
-        return response.json()["data"]["viewer"]["id"]
+        return self._graphql(query)["viewer"]["id"]
     
     def create_project(self, title: str) -> Tuple[str, int]:
         """Create a new project (ProjectsV2)"""
@@ -129,10 +302,7 @@ class GitHubAPI:
         }
         """
         variables = {"ownerId": user_id, "title": title}
-        response = requests.post(self.graphql_url, headers=self.graphql_headers,
-                                json={"query": mutation, "variables": variables})
-        response.raise_for_status()
-        data = response.json()["data"]["createProjectV2"]["projectV2"]
+        data = self._graphql(mutation, variables)["createProjectV2"]["projectV2"]
         return data["id"], data["number"]
     
     def add_issue_to_project(self, project_id: str, issue_node_id: str):
@@ -147,46 +317,111 @@ class GitHubAPI:
         }
         """
         variables = {"projectId": project_id, "contentId": issue_node_id}
-        response = requests.post(self.graphql_url, headers=self.graphql_headers,
-                                json={"query": mutation, "variables": variables})
-        response.raise_for_status()
+        self._graphql(mutation, variables)
+
+
+class IssueCache:
+    """Local SQLite snapshot of GitHub issues, keyed by node_id"""
+    
+    def __init__(self, path: str, repo: str):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS issues (node_id TEXT PRIMARY KEY, updated_at TEXT, payload TEXT)"
+        )
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        
+        # A cache built for another repo is useless - start over
+        if self.get_meta('repo') != repo:
+            self.conn.execute("DELETE FROM issues")
+            self.conn.execute("DELETE FROM meta")
+            self.set_meta('repo', repo)
+        self.conn.commit()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read a metadata value"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set_meta(self, key: str, value: str):
+        """Write a metadata value"""
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+        self.conn.commit()
+    
+    def store_issues(self, issues: List[Dict]):
+        """Insert or refresh issues"""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO issues (node_id, updated_at, payload) VALUES (?, ?, ?)",
+            [(issue['node_id'], issue.get('updated_at'), orjson.dumps(issue).decode()) for issue in issues]
+        )
+        self.conn.commit()
+    
+    def replace_issues(self, issues: List[Dict]):
+        """Replace the whole issue snapshot"""
+        self.conn.execute("DELETE FROM issues")
+        self.store_issues(issues)
+    
+    def delete_issues(self, node_ids: List[str]):
+        """Drop issues that no longer exist on GitHub"""
+        self.conn.executemany("DELETE FROM issues WHERE node_id = ?", [(n,) for n in node_ids])
+        self.conn.commit()
+    
+    def latest_update(self) -> Optional[str]:
+        """Newest updated_at among cached issues (GitHub server time)"""
+        return self.conn.execute("SELECT MAX(updated_at) FROM issues").fetchone()[0]
+    
+    def all_issues(self) -> List[Dict]:
+        """Return every cached issue"""
+        return [orjson.loads(row[0]) for row in self.conn.execute("SELECT payload FROM issues")]
 
 
 class TrackerParser:
-    TASK_PATTERN = r'^- \[([ x])\] (.+?)$'
-    FIELD_PATTERN = r'^\s+(\w+):\s*(.*)$'
-    SECTION_PATTERN = r'^## (.+)$'
+    TASK_RE = re.compile(r'^- \[([ x])\] (.+?)$')
+    FIELD_RE = re.compile(r'^\s+(\w+):\s*(.*)$')
+    SECTION_RE = re.compile(r'^## (.+)$')
     
     @staticmethod
-    def parse(content: str) -> List[Dict]:
-        """Parse tracker.md"""
+    def parse(lines: Iterable[str]) -> List[Dict]:
+        """Parse tracker.md, given as an iterable of lines (e.g. an open file)"""
         tasks = []
-        lines = content.split('\n')
         current_section = None
         current_task = None
         
         for line in lines:
+            line = line.rstrip('\r\n')
+            
             # Section header
-            if match := re.match(TrackerParser.SECTION_PATTERN, line):
-                current_section = match.group(1).strip()
+            if line.startswith('## '):
+                if match := TrackerParser.SECTION_RE.match(line):
+                    current_section = match.group(1).strip()
                 continue
             
             # Task line
-            if match := re.match(TrackerParser.TASK_PATTERN, line):
-                if current_task:
-                    tasks.append(current_task)
-                
-                current_task = {
-                    'checked': match.group(1) == 'x',
-                    'title': match.group(2).strip(),
-                    'section': current_section,
-                    'metadata': {},
-                    'raw_lines': [line]
-                }
+            if line.startswith('- ['):
+                if match := TrackerParser.TASK_RE.match(line):
+                    if current_task:
+                        tasks.append(current_task)
+                    
+                    current_task = {
+                        'checked': match.group(1) == 'x',
+                        'title': match.group(2).strip(),
+                        'section': current_section,
+                        'metadata': {},
+                        'raw_lines': [line]
+                    }
                 continue
             
-            # Metadata field
-            if current_task and (match := re.match(TrackerParser.FIELD_PATTERN, line)):
+            # Metadata field (always indented)
+            if current_task and line[:1].isspace() and (match := TrackerParser.FIELD_RE.match(line)):
                 key, value = match.groups()
                 current_task['metadata'][key] = value.strip()
                 current_task['raw_lines'].append(line)
@@ -205,17 +440,28 @@ class TrackerParser:
     @staticmethod
     def extract_tracker_id(body: str) -> Optional[str]:
         """Extract tracker-id from issue body"""
-        if match := re.search(r'<!-- tracker-id: (.+?) -->', body):
+        # Cheap substring check first; most bodies have no marker at all
+        idx = body.find('<!-- tracker-id:') if body else -1
+        if idx == -1:
+            return None
+        if match := TRACKER_ID_RE.search(body, idx):
             return match.group(1)
         return None
 
 
 class Sync:
-    def __init__(self, config: Dict, github: GitHubAPI):
+    def __init__(self, config: Dict, github: GitHubAPI, cache: IssueCache):
         self.config = config
         self.github = github
+        self.cache = cache
         self.project_id = None
         self.milestone_map = {}  # title -> number
+        self.milestones_fetched = False
+        self.milestone_lock = threading.Lock()
+        self.pending_github_field_updates = []  # (task_id, issue_number)
+        self.missing_issues = []  # node_ids that came back 404/410 on update
+        self.local_tasks_by_id = {}  # tracker-id -> task (IDEAS excluded)
+        self.tracker_sha256 = None  # hash of the tracker.md content this run parsed or wrote
     
     def run(self):
         """Main sync logic"""
@@ -231,35 +477,73 @@ class Sync:
         print("\n📖 Phase 2: Parsing tracker.md...")
         local_tasks = self.parse_tracker()
         
-        # Phase 3: Compute diff
-        print("\n🔍 Phase 3: Computing diff...")
-        changes = self.compute_diff(local_tasks, github_data)
-        
-        # Phase 4: Push to GitHub
-        print("\n📤 Phase 4: Pushing changes to GitHub...")
-        self.push_changes(changes, github_data)
+        # Compare the content just parsed, not whatever is on disk later
+        tracker_unchanged = (self.tracker_sha256 is not None and
+                             self.tracker_sha256 == self.cache.get_meta('tracker_sha256'))
+        if tracker_unchanged:
+            print("\n⏭️  tracker.md unchanged since last sync, skipping push")
+        else:
+            # Phase 3: Compute diff
+            print("\n🔍 Phase 3: Computing diff...")
+            changes = self.compute_diff(local_tasks, github_data)
+            
+            # Phase 4: Push to GitHub
+            print("\n📤 Phase 4: Pushing changes to GitHub...")
+            self.push_changes(changes, github_data)
         
         # Phase 5: Pull UI changes
         print("\n⬇️  Phase 5: Pulling GitHub UI changes...")
-        ui_changes = self.detect_ui_changes(github_data, local_tasks)
+        ui_changes = self.detect_ui_changes(github_data)
         
         # Phase 6: Update tracker.md
         if ui_changes:
             print("\n💾 Phase 6: Updating tracker.md...")
             self.update_tracker(ui_changes)
         
+        self.github.save_etag_cache()
+        self.record_tracker_state()
+        
         print("\n" + "=" * 70)
         print("✅ Sync complete!")
         print("=" * 70)
     
+    def record_tracker_state(self):
+        """Remember the hash of the tracker.md content this run synced"""
+        if self.tracker_sha256 is None:
+            return
+        if not os.path.exists(TRACKER_FILE) or self.hash_tracker() != self.tracker_sha256:
+            print(f"  ⚠️  {TRACKER_FILE} changed during sync; it will be pushed next run")
+            return
+        self.cache.set_meta('tracker_sha256', self.tracker_sha256)
+    
+    @staticmethod
+    def hash_tracker() -> str:
+        """SHA-256 of tracker.md's contents"""
+        with open(TRACKER_FILE, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    
     def pull_github_state(self) -> Dict:
         """Pull all data from GitHub"""
-        issues = self.github.get_issues()
-        milestones = self.github.get_milestones()
-        
-        # Build milestone map
-        for ms in milestones:
-            self.milestone_map[ms['title']] = ms['number']
+        # Periodically refetch everything so deleted/transferred issues drop out of the cache
+        last_full_refresh = self.cache.get_meta('last_full_refresh')
+        if last_full_refresh is None or time.time() - float(last_full_refresh) >= FULL_REFRESH_SECONDS:
+            print("  🔄 Full refresh of cached issues...")
+            changed = self.github.get_issues_graphql()
+            self.cache.replace_issues(changed)
+            self.cache.set_meta('last_full_refresh', str(time.time()))
+        else:
+            # Otherwise only fetch issues updated since the newest one cached. The cursor
+            # comes from GitHub's own timestamps so local clock skew can't skip updates
+            since = None
+            if latest := self.cache.latest_update():
+                since = (datetime.strptime(latest, '%Y-%m-%dT%H:%M:%SZ') -
+                         timedelta(seconds=SINCE_OVERLAP_SECONDS)).strftime('%Y-%m-%dT%H:%M:%SZ')
+            changed = self.github.get_issues_graphql(since=since)
+            self.cache.store_issues(changed)
+        issues = self.cache.all_issues()
+        
+        # Build milestone map from the milestones issues already carry
+        self.milestone_map = {ms['title']: ms['number'] for issue in issues if (ms := issue.get('milestone'))}
         
         # Build tracker-id map
         tracker_map = {}
@@ -270,27 +554,54 @@ class Sync:
                     'title': issue['title'],
                     'state': issue['state'],
                     'labels': [l['name'] for l in issue.get('labels', [])],
-                    'milestone': issue.get('milestone', {}).get('title') if issue.get('milestone') else None,
+                    '_label_set': frozenset(l['name'] for l in issue.get('labels', [])),
+                    'milestone': (issue.get('milestone') or {}).get('title') or None,
                     'node_id': issue['node_id']
                 }
         
-        print(f"  ✓ Found {len(issues)} issues ({len(tracker_map)} with tracker-id)")
+        print(f"  ✓ Found {len(issues)} issues ({len(changed)} changed, {len(tracker_map)} with tracker-id)")
         return {
             'issues': issues,
-            'tracker_map': tracker_map,
-            'milestones': milestones
+            'tracker_map': tracker_map
         }
     
+    def milestone_number(self, title: Optional[str]) -> Optional[int]:
+        """Look up a milestone number, fetching the full milestone list once on a miss"""
+        if not title:
+            return None
+        with self.milestone_lock:
+            if title not in self.milestone_map and not self.milestones_fetched:
+                for ms in self.github.get_milestones():
+                    self.milestone_map[ms['title']] = ms['number']
+                self.milestones_fetched = True
+        return self.milestone_map.get(title)
+    
     def parse_tracker(self) -> List[Dict]:
         """Parse tracker.md file"""
         if not os.path.exists(TRACKER_FILE):
             print(f"  ✗ {TRACKER_FILE} not found!")
             return []
         
-        with open(TRACKER_FILE, 'r') as f:
-            content = f.read()
+        digest = hashlib.sha256()
+        
+        def hashed(f):
+            for line in f:
+                digest.update(line.encode('utf-8'))
+                yield line
+        
+        with open(TRACKER_FILE, 'r', encoding='utf-8', newline='') as f:
+            tasks = TrackerParser.parse(hashed(f))
+        self.tracker_sha256 = digest.hexdigest()
         
-        tasks = TrackerParser.parse(content)
+        for task in tasks:
+            task['_label_set'] = frozenset(
+                l.strip() for l in task['metadata'].get('labels', '').split(',') if l.strip()
+            )
+            task['_milestone'] = task['metadata'].get('milestone') or None  # '' and missing alike
+        self.local_tasks_by_id = {
+            t['metadata']['id']: t for t in tasks
+            if t['metadata'].get('id') and t['section'] != 'IDEAS'
+        }
         print(f"  ✓ Parsed {len(tasks)} tasks")
         return tasks
     
@@ -333,14 +644,11 @@ class Sync:
             if task['title'] != github_issue['title']:
                 needs_update['title'] = task['title']
             
-            local_labels = set(task['metadata'].get('labels', '').split(','))
-            github_labels = set(github_issue['labels'])
-            if local_labels != github_labels:
-                needs_update['labels'] = list(local_labels)
+            if task['_label_set'] != github_issue['_label_set']:
+                needs_update['labels'] = list(task['_label_set'])
             
-            local_milestone = task['metadata'].get('milestone', '')
-            if local_milestone != github_issue.get('milestone', ''):
-                needs_update['milestone'] = local_milestone
+            if task['_milestone'] != github_issue['milestone']:
+                needs_update['milestone'] = task['_milestone']
             
             # State changes
             should_be_closed = task['checked']
@@ -356,6 +664,7 @@ class Sync:
                     'action': 'update',
                     'task_id': task_id,
                     'github_number': github_issue['number'],
+                    'node_id': github_issue['node_id'],
                     'updates': needs_update
                 })
         
@@ -376,13 +685,51 @@ class Sync:
             )
             print(f"  ✓ Created project #{project_num}")
         
-        for change in changes:
-            if change['action'] == 'create':
-                self.create_issue_on_github(change, github_data)
-                time.sleep(0.2)  # Rate limiting
-            elif change['action'] == 'update':
-                self.update_issue_on_github(change)
-                time.sleep(0.2)
+        try:
+            asyncio.run(self._push_all(changes, github_data))
+        finally:
+            # Record issue numbers even if a later change failed, so reruns don't duplicate
+            self.flush_github_field_updates()
+            if self.missing_issues:
+                # Worker threads can't use the SQLite connection; drop them here and
+                # force a full refresh next run to catch any other deleted issues
+                self.cache.delete_issues(self.missing_issues)
+                self.cache.set_meta('last_full_refresh', '0')
+                self.missing_issues = []
+    
+    async def _push_all(self, changes: List[Dict], github_data: Dict):
+        """Create issues one at a time while updates run concurrently, bounded by PUSH_CONCURRENCY"""
+        sem = asyncio.Semaphore(PUSH_CONCURRENCY)
+        creates = [c for c in changes if c['action'] == 'create']
+        updates = [c for c in changes if c['action'] == 'update']
+        results = await asyncio.gather(
+            self._create_all(creates, github_data),
+            *[self._update(change, sem) for change in updates],
+            return_exceptions=True
+        )
+        
+        errors = [r for r in results if isinstance(r, Exception)]
+        for error in errors:
+            print(f"  ✗ {error}")
+        if errors:
+            raise errors[0]
+    
+    async def _create_all(self, creates: List[Dict], github_data: Dict):
+        """Create issues serially, as GitHub asks for content-creating requests"""
+        for change in creates:
+            await asyncio.to_thread(self.create_issue_on_github, change, github_data)
+    
+    async def _update(self, change: Dict, sem: asyncio.Semaphore):
+        """Apply one update on a worker thread"""
+        async with sem:
+            await asyncio.to_thread(self.update_issue_on_github, change)
+    
+    def flush_github_field_updates(self):
+        """Write all pending github: field updates to tracker.md in one rewrite"""
+        if not self.pending_github_field_updates:
+            return
+        self.update_tracker_github_field(dict(self.pending_github_field_updates))
+        self.pending_github_field_updates = []
     
     def create_issue_on_github(self, change: Dict, github_data: Dict):
         """Create a new issue on GitHub"""
@@ -400,11 +747,10 @@ class Sync:
 """
         
         # Get milestone number
-        milestone_name = task['metadata'].get('milestone', '')
-        milestone_num = self.milestone_map.get(milestone_name)
+        milestone_num = self.milestone_number(task['_milestone'])
         
         # Get labels
-        labels = [l.strip() for l in task['metadata'].get('labels', '').split(',') if l.strip()]
+        labels = list(task['_label_set'])
         
         print(f"  ➕ Creating: {task['title']}")
         issue = self.github.create_issue(
@@ -418,8 +764,8 @@ class Sync:
         if self.project_id:
             self.github.add_issue_to_project(self.project_id, issue['node_id'])
         
-        # Update tracker.md with issue number
-        self.update_tracker_github_field(task_id, issue['number'])
+        # Queue tracker.md update; written once after all changes are pushed
+        self.pending_github_field_updates.append((task_id, issue['number']))
         
         print(f"    ✓ Created #{issue['number']}")
     
@@ -431,32 +777,31 @@ class Sync:
         print(f"  📝 Updating #{number}: {', '.join(updates.keys())}")
         
         # Prepare update data
-        milestone_num = None
-        if 'milestone' in updates:
-            milestone_name = updates['milestone']
-            milestone_num = self.milestone_map.get(milestone_name)
-        
-        self.github.update_issue(
-            number=number,
-            title=updates.get('title'),
-            labels=updates.get('labels'),
-            milestone=milestone_num,
-            state=updates.get('state')
-        )
-        print(f"    ✓ Updated")
+        milestone_num = self.milestone_number(updates.get('milestone'))
+        
+        try:
+            self.github.update_issue(
+                number=number,
+                title=updates.get('title'),
+                labels=updates.get('labels'),
+                milestone=milestone_num,
+                state=updates.get('state')
+            )
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in (404, 410):
+                raise
+            print(f"    ⚠️  #{number} no longer exists on GitHub, dropping it from the cache")
+            self.missing_issues.append(change['node_id'])
+            return
+        print(f"    ✓ Updated #{number}")
     
-    def detect_ui_changes(self, github_data: Dict, local_tasks: List[Dict]) -> List[Dict]:
+    def detect_ui_changes(self, github_data: Dict) -> List[Dict]:
         """Detect changes made on GitHub UI"""
         ui_changes = []
-        tracker_map = github_data['tracker_map']
         
-        for task in local_tasks:
-            task_id = task['metadata'].get('id', '')
-            if not task_id or task['section'] == 'IDEAS':
-                continue
-            
-            github_issue = tracker_map.get(task_id)
-            if not github_issue:
+        for task_id, github_issue in github_data['tracker_map'].items():
+            task = self.local_tasks_by_id.get(task_id)
+            if not task:
                 continue
             
             # Check if closed on GitHub but not locally
@@ -481,60 +826,81 @@ class Sync:
     
     def update_tracker(self, ui_changes: List[Dict]):
         """Update tracker.md based on GitHub UI changes"""
-        with open(TRACKER_FILE, 'r') as f:
-            lines = f.readlines()
+        lines = self.read_tracker()
         
-        # Apply changes
-        current_id = None
+        # Apply changes in a single pass: the id: field follows its task line
+        changes_by_id = {change['task_id']: change['action'] for change in ui_changes}
+        last_task_idx = None
         for i, line in enumerate(lines):
-            # Detect ID line
-            if match := re.match(r'\s+id:\s*(.+)$', line):
-                current_id = match.group(1).strip()
+            if TrackerParser.TASK_RE.match(line):
+                last_task_idx = i
+                continue
             
-            # Check if this task needs update
-            for change in ui_changes:
-                if change['task_id'] == current_id:
-                    # Find task line (search backwards)
-                    for j in range(i-1, -1, -1):
-                        if re.match(TrackerParser.TASK_PATTERN, lines[j]):
-                            if change['action'] == 'mark_done':
-                                lines[j] = lines[j].replace('[ ]', '[x]')
-                                print(f"  ✓ Marked {current_id} as done")
-                            elif change['action'] == 'mark_todo':
-                                lines[j] = lines[j].replace('[x]', '[ ]')
-                                print(f"  ✓ Marked {current_id} as todo")
-                            break
-        
-        # Write atomically
-        temp_file = TRACKER_FILE + '.tmp'
-        with open(temp_file, 'w') as f:
-            f.writelines(lines)
-        os.replace(temp_file, TRACKER_FILE)
+            match = ID_FIELD_RE.match(line)
+            if not match or last_task_idx is None:
+                continue
+            
+            task_id = match.group(1).strip()
+            action = changes_by_id.pop(task_id, None)
+            if action == 'mark_done':
+                lines[last_task_idx] = '- [x]' + lines[last_task_idx][5:]
+                print(f"  ✓ Marked {task_id} as done")
+            elif action == 'mark_todo':
+                lines[last_task_idx] = '- [ ]' + lines[last_task_idx][5:]
+                print(f"  ✓ Marked {task_id} as todo")
+        
+        self.write_tracker(lines)
         print(f"  ✓ Updated {TRACKER_FILE}")
     
-    def update_tracker_github_field(self, task_id: str, issue_number: int):
-        """Update the github: field in tracker.md"""
-        with open(TRACKER_FILE, 'r') as f:
-            lines = f.readlines()
+    def update_tracker_github_field(self, issue_numbers: Dict[str, int]):
+        """Update the github: field in tracker.md for each task_id -> issue number"""
+        lines = self.read_tracker()
         
+        # Single pass: remember the current task's id and github: line, whichever comes first
         current_id = None
+        github_idx = None
         for i, line in enumerate(lines):
-            if match := re.match(r'\s+id:\s*(.+)$', line):
+            if TrackerParser.TASK_RE.match(line):
+                current_id = None
+                github_idx = None
+            elif match := ID_FIELD_RE.match(line):
                 current_id = match.group(1).strip()
+            elif GITHUB_FIELD_RE.match(line):
+                github_idx = i
+            else:
+                continue
             
-            if current_id == task_id:
-                # Find github: line
-                for j in range(i, min(i+10, len(lines))):
-                    if re.match(r'\s+github:\s*', lines[j]):
-                        lines[j] = f"  github: {issue_number}\n"
-                        break
-                break
+            if github_idx is not None and current_id in issue_numbers:
+                old_line = lines[github_idx]
+                ending = old_line[len(old_line.rstrip('\r\n')):]  # keep the file's line endings
+                lines[github_idx] = f"  github: {issue_numbers[current_id]}{ending}"
+                github_idx = None
         
-        # Write
+        self.write_tracker(lines)
+    
+    def read_tracker(self) -> List[str]:
+        """Read tracker.md lines, noting if they differ from what this run parsed"""
+        with open(TRACKER_FILE, 'r', encoding='utf-8', newline='') as f:
+            lines = f.readlines()
+        if hashlib.sha256(''.join(lines).encode('utf-8')).hexdigest() != self.tracker_sha256:
+            # Edited mid-sync: keep the user's edits but don't record them as synced
+            if self.tracker_sha256 is not None:
+                print(f"  ⚠️  {TRACKER_FILE} changed during sync; it will be pushed next run")
+            self.tracker_sha256 = None
+        return lines
+    
+    def write_tracker(self, lines: List[str]):
+        """Atomically replace tracker.md: one write to a temp file, fsync, then rename"""
+        # Readers use UTF-8 with newline='', so this writes back exactly what was read
+        data = ''.join(lines).encode('utf-8')
         temp_file = TRACKER_FILE + '.tmp'
-        with open(temp_file, 'w') as f:
-            f.writelines(lines)
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(temp_file, TRACKER_FILE)
+        if self.tracker_sha256 is not None:
+            self.tracker_sha256 = hashlib.sha256(data).hexdigest()
 
 
 def main():
@@ -544,7 +910,7 @@ def main():
         sys.exit(1)
     
     with open(CONFIG_FILE, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAML_LOADER)
     
     # Get GitHub token
     token = os.environ.get('GITHUB_TOKEN')
@@ -553,17 +919,19 @@ def main():
         sys.exit(1)
     
     # Initialize
-    github = GitHubAPI(token, config['repo_owner'], config['repo_name'])
-    sync = Sync(config, github)
-    
-    # Run sync
-    try:
-        sync.run()
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    repo = f"{config['repo_owner']}/{config['repo_name']}"
+    with GitHubAPI(token, config['repo_owner'], config['repo_name']) as github, \
+            IssueCache(CACHE_FILE, repo) as cache:
+        sync = Sync(config, github, cache)
+        
+        # Run sync
+        try:
+            sync.run()
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
 
 
 if __name__ == "__main__":